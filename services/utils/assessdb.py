@@ -1,50 +1,225 @@
+import asyncio
 import sqlite3
 import os
 import json
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 # Database setup
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "assessment.db")
 
+# Hot statements kept as module-level constants: passing the same string
+# object every call guarantees hits in the connection's prepared-statement
+# cache, skipping the SQL parser entirely on repeat queries
+_SQL_UPSERT_VIDEO_PREFIX = 'INSERT INTO eph.video_questions (user_id, slot, question, correct_answer, video_id) VALUES '
+_SQL_UPSERT_VIDEO_SUFFIX = '''
+    ON CONFLICT(user_id, slot) DO UPDATE SET
+        question = excluded.question,
+        correct_answer = excluded.correct_answer,
+        video_id = excluded.video_id
+'''
+_SQL_UPSERT_VIDEO_QUESTION = _SQL_UPSERT_VIDEO_PREFIX + '(?, ?, ?, ?, ?)' + _SQL_UPSERT_VIDEO_SUFFIX
+_SQL_UPSERT_APTITUDE_PREFIX = 'INSERT INTO eph.aptitude_questions (user_id, slot, question, correct_answer) VALUES '
+_SQL_UPSERT_APTITUDE_SUFFIX = '''
+    ON CONFLICT(user_id, slot) DO UPDATE SET
+        question = excluded.question,
+        correct_answer = excluded.correct_answer
+'''
+_SQL_UPSERT_APTITUDE_QUESTION = _SQL_UPSERT_APTITUDE_PREFIX + '(?, ?, ?, ?)' + _SQL_UPSERT_APTITUDE_SUFFIX
+_SQL_INSERT_ASSESSMENT = '''
+    INSERT INTO user_assessments (user_id, video_score, aptitude_score, learner_type)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_DELETE_VIDEO_QUESTIONS = 'DELETE FROM eph.video_questions WHERE user_id = ?'
+_SQL_DELETE_APTITUDE_QUESTIONS = 'DELETE FROM eph.aptitude_questions WHERE user_id = ?'
+_SQL_TRIM_VIDEO_QUESTIONS = 'DELETE FROM eph.video_questions WHERE user_id = ? AND slot >= ?'
+_SQL_TRIM_APTITUDE_QUESTIONS = 'DELETE FROM eph.aptitude_questions WHERE user_id = ? AND slot >= ?'
+_SQL_NEXT_VIDEO_SLOT = 'SELECT COALESCE(MAX(slot) + 1, 0) FROM eph.video_questions WHERE user_id = ?'
+_SQL_NEXT_APTITUDE_SLOT = 'SELECT COALESCE(MAX(slot) + 1, 0) FROM eph.aptitude_questions WHERE user_id = ?'
+
+# Per-table statement lookup for the generic question helpers below
+_QUESTION_SQL = {
+    'video_questions': {
+        'next_slot': _SQL_NEXT_VIDEO_SLOT,
+        'upsert': _SQL_UPSERT_VIDEO_QUESTION,
+        'delete': _SQL_DELETE_VIDEO_QUESTIONS,
+    },
+    'aptitude_questions': {
+        'next_slot': _SQL_NEXT_APTITUDE_SLOT,
+        'upsert': _SQL_UPSERT_APTITUDE_QUESTION,
+        'delete': _SQL_DELETE_APTITUDE_QUESTIONS,
+    },
+}
+_SQL_GET_VIDEO_QUESTIONS = '''
+    SELECT slot AS id, question, correct_answer, video_id
+    FROM eph.video_questions
+    WHERE user_id = ?
+    ORDER BY slot
+    LIMIT 5
+'''
+_SQL_GET_APTITUDE_QUESTIONS = '''
+    SELECT slot AS id, question, correct_answer
+    FROM eph.aptitude_questions
+    WHERE user_id = ?
+    ORDER BY slot
+    LIMIT 5
+'''
+_SQL_ASSESSMENT_HISTORY = '''
+    SELECT id, video_score, aptitude_score, learner_type, assessment_date
+    FROM user_assessments
+    WHERE user_id = ?
+    ORDER BY assessment_date DESC
+'''
+_ASSESSMENT_HISTORY_KEYS = ('id', 'video_score', 'aptitude_score', 'learner_type', 'assessment_date')
+_SQL_LATEST_LEARNER_TYPE = '''
+    SELECT learner_type FROM user_assessments
+    WHERE user_id = ?
+    ORDER BY assessment_date DESC
+    LIMIT 1
+'''
+
+# Single long-lived connection shared by all functions; SQLite serializes
+# writes internally, the lock keeps our write transactions from interleaving
+_conn = None
+_lock = threading.Lock()
+
+# Latest learner type per user: the value only changes when
+# save_user_assessment runs, so the writer refreshes the entry directly
+# and repeat lookups never touch SQLite; bounded by dropping the oldest
+# entry once the cap is reached
+_latest_lt_cache: Dict[str, Optional[str]] = {}
+_LATEST_LT_CACHE_MAX = 10000
+
+def _cache_learner_type(user_id: str, learner_type: Optional[str]):
+    """Record a user's latest learner type in the bounded in-process cache"""
+    if len(_latest_lt_cache) >= _LATEST_LT_CACHE_MAX and user_id not in _latest_lt_cache:
+        _latest_lt_cache.pop(next(iter(_latest_lt_cache)))
+    _latest_lt_cache[user_id] = learner_type
+
 def ensure_db_directory():
     """Ensure the directory for the database exists"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
+def apply_connection_pragmas(conn):
+    """Apply performance PRAGMAs that every connection should use"""
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=30000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-20000')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    # Checkpoint far less often than the 1000-page default; frequent small
+    # commits then append to the WAL without periodic fsync spikes, and
+    # checkpoint() reclaims the WAL during quiet periods instead
+    cursor.execute('PRAGMA wal_autocheckpoint=10000')
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared connection, creating it lazily on first use"""
+    global _conn
+    if _conn is None:
+        with _lock:
+            if _conn is None:
+                ensure_db_directory()
+                conn = sqlite3.connect(
+                    DB_PATH,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=256,
+                )
+                apply_connection_pragmas(conn)
+                # Question tables only ever hold the current 5-question set
+                # per user, so they live in an attached in-memory database:
+                # saving questions never touches the WAL or the disk, and
+                # only user_assessments pays for durability
+                conn.execute("ATTACH DATABASE ':memory:' AS eph")
+                # Build the schema before publishing the connection so no
+                # other thread can query tables that don't exist yet
+                _initialize_schema(conn)
+                _conn = conn
+    return _conn
+
+def checkpoint():
+    """
+    Fold the WAL back into the main database and refresh planner statistics
+
+    PASSIVE mode never blocks readers or writers, so this is safe to run
+    from a cron job, a lifespan shutdown hook, or the maintenance loop.
+    """
+    conn = _get_conn()
+    with _lock:
+        conn.execute('PRAGMA optimize')
+        conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+
+async def maintenance_loop(interval_seconds: int = 900):
+    """Run checkpoint() periodically; schedule with asyncio.create_task at startup"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(checkpoint)
+
+def close_db():
+    """Close the shared connection, refreshing planner statistics first"""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.execute('PRAGMA optimize')
+            _conn.close()
+            _conn = None
+
 def initialize_db():
-    """Initialize the database with necessary tables"""
-    ensure_db_directory()
-    
-    conn = sqlite3.connect(DB_PATH)
+    """
+    Initialize the database with necessary tables
+
+    The schema is built once when the shared connection is created, so this
+    only exists as an explicit app-startup hook to front-load that work;
+    repeat calls are no-ops.
+    """
+    _get_conn()
+
+def _initialize_schema(conn: sqlite3.Connection):
+    """Run the schema DDL and migrations on a freshly created connection"""
     cursor = conn.cursor()
-    
-    # Drop existing tables if they exist to recreate with user_id field
-    cursor.execute('DROP TABLE IF EXISTS video_questions')
-    cursor.execute('DROP TABLE IF EXISTS aptitude_questions')
-    
-    # Create table for video questions with user_id
+
+    # WAL lets concurrent readers proceed while a writer commits; the journal
+    # mode is persistent in the database file so setting it once is enough
+    cursor.execute('PRAGMA journal_mode=WAL')
+
+    # One-time migrations, marked done via user_version so later startups
+    # leave existing data untouched: v1 rebuilt the question tables with a
+    # user_id column, v2 moved them to the slot schema and off the main
+    # database file, leaving only the drop of any stale on-disk copies
+    schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+    if schema_version < 2:
+        cursor.execute('DROP TABLE IF EXISTS main.video_questions')
+        cursor.execute('DROP TABLE IF EXISTS main.aptitude_questions')
+        cursor.execute('PRAGMA user_version = 2')
+
+    # Question tables are keyed on (user_id, slot) so a re-assessment
+    # overwrites the five rows in place via upsert instead of delete+insert;
+    # they live in the attached in-memory database and are rebuilt per process
     cursor.execute('''
-    CREATE TABLE IF NOT EXISTS video_questions (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
+    CREATE TABLE IF NOT EXISTS eph.video_questions (
         user_id TEXT NOT NULL,
+        slot INTEGER NOT NULL,
         question TEXT NOT NULL,
         correct_answer TEXT NOT NULL,
         video_id TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, slot)
+    ) WITHOUT ROWID
     ''')
-    
-    # Create table for aptitude questions with user_id
+
     cursor.execute('''
-    CREATE TABLE IF NOT EXISTS aptitude_questions (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
+    CREATE TABLE IF NOT EXISTS eph.aptitude_questions (
         user_id TEXT NOT NULL,
+        slot INTEGER NOT NULL,
         question TEXT NOT NULL,
         correct_answer TEXT NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, slot)
+    ) WITHOUT ROWID
     ''')
-    
+
     # Create table for user assessment results
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS user_assessments (
@@ -56,299 +231,269 @@ def initialize_db():
         assessment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     ''')
-    
-    conn.commit()
-    conn.close()
 
-def clear_previous_video_questions(user_id: str):
+    # The (user_id, slot) primary keys already cover the question lookups;
+    # assessments still need a composite index for the per-user history scan
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ua_user_date ON user_assessments(user_id, assessment_date DESC)')
+
+# Rows per multi-row VALUES statement; well under SQLite's 32766 bound
+# variable limit even at five columns per row
+_MAX_ROWS_PER_INSERT = 500
+
+def _multirow_upsert(cursor: sqlite3.Cursor, prefix: str, suffix: str, params: List[tuple]):
+    """
+    Upsert a batch of rows through multi-row VALUES statements
+
+    A single statement binds the whole batch into one VDBE program, which
+    beats executemany's per-row bind/step loop for the usual five-question
+    batch; larger batches are chunked to respect the bind-variable limit.
+    """
+    for start in range(0, len(params), _MAX_ROWS_PER_INSERT):
+        chunk = params[start:start + _MAX_ROWS_PER_INSERT]
+        placeholders = ', '.join(['(' + ', '.join(['?'] * len(chunk[0])) + ')'] * len(chunk))
+        flat = [value for row in chunk for value in row]
+        cursor.execute(prefix + placeholders + suffix, flat)
+
+def _save_question(table: str, user_id: str, values: tuple) -> int:
+    """Upsert a question into the user's next free slot and return the slot"""
+    sql = _QUESTION_SQL[table]
+    cursor = _get_conn().cursor()
+    with _lock:
+        slot = cursor.execute(sql['next_slot'], (user_id,)).fetchone()[0]
+        cursor.execute(sql['upsert'], (user_id, slot) + values)
+        return slot
+
+def _clear_questions(table: str, user_id: str, cursor: sqlite3.Cursor = None):
+    """
+    Delete all stored questions in the given table for a user
+
+    When a cursor is supplied the delete joins the caller's open
+    transaction instead of committing on its own.
+    """
+    sql = _QUESTION_SQL[table]['delete']
+    if cursor is not None:
+        cursor.execute(sql, (user_id,))
+        return
+
+    cursor = _get_conn().cursor()
+    with _lock:
+        cursor.execute(sql, (user_id,))
+
+def clear_previous_video_questions(user_id: str, cursor: sqlite3.Cursor = None):
     """Delete all previous video questions for a user"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        DELETE FROM video_questions WHERE user_id = ?
-        ''',
-        (user_id,)
-    )
-    
-    conn.commit()
-    conn.close()
+    _clear_questions('video_questions', user_id, cursor)
 
-def clear_previous_aptitude_questions(user_id: str):
+def clear_previous_aptitude_questions(user_id: str, cursor: sqlite3.Cursor = None):
     """Delete all previous aptitude questions for a user"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        DELETE FROM aptitude_questions WHERE user_id = ?
-        ''',
-        (user_id,)
-    )
-    
-    conn.commit()
-    conn.close()
+    _clear_questions('aptitude_questions', user_id, cursor)
 
 def save_video_question(user_id: str, question: str, correct_answer: str, video_id: str = None) -> int:
     """
     Save a video question to the database
-    
+
     Args:
         user_id: The ID of the user
         question: The question text
         correct_answer: The correct answer
         video_id: YouTube video ID (optional)
-        
+
     Returns:
         The ID of the inserted question
     """
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        INSERT INTO video_questions (user_id, question, correct_answer, video_id)
-        VALUES (?, ?, ?, ?)
-        ''',
-        (user_id, question, correct_answer, video_id)
-    )
-    
-    question_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    
-    return question_id
+    return _save_question('video_questions', user_id, (question, correct_answer, video_id))
 
 def save_aptitude_question(user_id: str, question: str, correct_answer: str) -> int:
     """
     Save an aptitude question to the database
-    
+
     Args:
         user_id: The ID of the user
         question: The question text
         correct_answer: The correct answer
-        
+
     Returns:
         The ID of the inserted question
     """
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        INSERT INTO aptitude_questions (user_id, question, correct_answer)
-        VALUES (?, ?, ?)
-        ''',
-        (user_id, question, correct_answer)
-    )
-    
-    question_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    
-    return question_id
+    return _save_question('aptitude_questions', user_id, (question, correct_answer))
 
 def save_user_assessment(user_id: str, video_score: int, aptitude_score: int, learner_type: str) -> int:
     """
     Save a user's assessment results
-    
+
     Args:
         user_id: The ID of the user
         video_score: Number of video questions answered correctly
         aptitude_score: Number of aptitude questions answered correctly
         learner_type: The determined learner type ('slow', 'medium', 'fast')
-        
+
     Returns:
         The ID of the inserted assessment
     """
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        INSERT INTO user_assessments (user_id, video_score, aptitude_score, learner_type)
-        VALUES (?, ?, ?, ?)
-        ''',
-        (user_id, video_score, aptitude_score, learner_type)
-    )
-    
-    assessment_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    
-    return assessment_id
+    cursor = _get_conn().cursor()
+    with _lock:
+        cursor.execute(_SQL_INSERT_ASSESSMENT, (user_id, video_score, aptitude_score, learner_type))
+        _cache_learner_type(user_id, learner_type)
+        return cursor.lastrowid
 
 def get_user_assessment_history(user_id: str) -> List[Dict[str, Any]]:
     """Get all assessment results for a specific user"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        SELECT * FROM user_assessments
-        WHERE user_id = ?
-        ORDER BY assessment_date DESC
-        ''',
-        (user_id,)
-    )
-    
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
-    return results
+    cursor = _get_conn().execute(_SQL_ASSESSMENT_HISTORY, (user_id,))
+
+    # The column list is known, so build dicts straight from the tuples
+    # rather than paying for a sqlite3.Row wrapper per row
+    return [dict(zip(_ASSESSMENT_HISTORY_KEYS, row)) for row in cursor.fetchall()]
 
 def get_latest_learner_type(user_id: str) -> Optional[str]:
     """Get the latest determined learner type for a user"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        SELECT learner_type FROM user_assessments
-        WHERE user_id = ?
-        ORDER BY assessment_date DESC
-        LIMIT 1
-        ''',
-        (user_id,)
-    )
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if result:
-        return result[0]
-    return None
+    if user_id in _latest_lt_cache:
+        return _latest_lt_cache[user_id]
+
+    # Plain tuple cursor on purpose: this runs on every request, so skip
+    # the Row wrapping and unpack the single scalar directly
+    row = _get_conn().execute(_SQL_LATEST_LEARNER_TYPE, (user_id,)).fetchone()
+    learner_type = row[0] if row else None
+    _cache_learner_type(user_id, learner_type)
+    return learner_type
 
 def bulk_save_video_questions(user_id: str, questions_data: List[Dict[str, Any]], video_id: str = None) -> List[int]:
     """
     Save multiple video questions in bulk for a specific user, replacing any previous questions
-    
+
     Args:
         user_id: The ID of the user
         questions_data: List of question dictionaries with 'question' and 'correct_answer'
         video_id: YouTube video ID (optional)
-        
+
     Returns:
         List of inserted question IDs
     """
-    # First, clear out previous questions for this user
-    clear_previous_video_questions(user_id)
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    question_ids = []
-    for q_data in questions_data:
-        cursor.execute(
-            '''
-            INSERT INTO video_questions (user_id, question, correct_answer, video_id)
-            VALUES (?, ?, ?, ?)
-            ''',
-            (user_id, q_data['question'], q_data['correct_answer'], video_id)
-        )
-        
-        question_ids.append(cursor.lastrowid)
-    
-    conn.commit()
-    conn.close()
-    
-    return question_ids
+    params = [
+        (user_id, slot, q_data['question'], q_data['correct_answer'], video_id)
+        for slot, q_data in enumerate(questions_data)
+    ]
+
+    conn = _get_conn()
+    with _lock:
+        cursor = conn.cursor()
+
+        # Upserting onto the (user_id, slot) key overwrites the previous
+        # question set in place; the trim only fires when the new set is
+        # smaller than the old one, so the common path never deletes pages
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            _multirow_upsert(cursor, _SQL_UPSERT_VIDEO_PREFIX, _SQL_UPSERT_VIDEO_SUFFIX, params)
+            cursor.execute(_SQL_TRIM_VIDEO_QUESTIONS, (user_id, len(params)))
+            conn.commit()
+        except Exception:
+            # Roll back so the shared connection never leaks an open
+            # transaction into later autocommit writes
+            conn.rollback()
+            raise
+
+    return list(range(len(params)))
 
 def bulk_save_aptitude_questions(user_id: str, questions_data: List[Dict[str, Any]]) -> List[int]:
     """
     Save multiple aptitude questions in bulk for a specific user, replacing any previous questions
-    
+
     Args:
         user_id: The ID of the user
         questions_data: List of question dictionaries with 'question' and 'correct_answer'
-        
+
     Returns:
         List of inserted question IDs
     """
-    # First, clear out previous questions for this user
-    clear_previous_aptitude_questions(user_id)
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    question_ids = []
-    for q_data in questions_data:
-        cursor.execute(
-            '''
-            INSERT INTO aptitude_questions (user_id, question, correct_answer)
-            VALUES (?, ?, ?)
-            ''',
-            (user_id, q_data['question'], q_data['correct_answer'])
-        )
-        
-        question_ids.append(cursor.lastrowid)
-    
-    conn.commit()
-    conn.close()
-    
-    return question_ids
-
-def get_video_questions(user_id: str) -> List[Dict[str, Any]]:
+    params = [
+        (user_id, slot, q_data['question'], q_data['correct_answer'])
+        for slot, q_data in enumerate(questions_data)
+    ]
+
+    conn = _get_conn()
+    with _lock:
+        cursor = conn.cursor()
+
+        # Upserting onto the (user_id, slot) key overwrites the previous
+        # question set in place; the trim only fires when the new set is
+        # smaller than the old one, so the common path never deletes pages
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            _multirow_upsert(cursor, _SQL_UPSERT_APTITUDE_PREFIX, _SQL_UPSERT_APTITUDE_SUFFIX, params)
+            cursor.execute(_SQL_TRIM_APTITUDE_QUESTIONS, (user_id, len(params)))
+            conn.commit()
+        except Exception:
+            # Roll back so the shared connection never leaks an open
+            # transaction into later autocommit writes
+            conn.rollback()
+            raise
+
+    return list(range(len(params)))
+
+def get_video_questions(user_id: str) -> List[sqlite3.Row]:
     """
     Get all video questions for a specific user
-    
+
     Args:
         user_id: The ID of the user
-        
+
     Returns:
-        List of dictionaries with question text and correct answers
+        List of sqlite3.Row objects with question text and correct answers;
+        rows support both row['question'] and positional access, so no
+        per-row dict is materialized (use dict(row) if one is needed)
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        SELECT id, question, correct_answer, video_id
-        FROM video_questions
-        WHERE user_id = ?
-        ORDER BY id
-        LIMIT 5
-        ''',
-        (user_id,)
-    )
-    
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
-    return results
+    cursor = _get_conn().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(_SQL_GET_VIDEO_QUESTIONS, (user_id,))
+
+    return cursor.fetchall()
 
-def get_aptitude_questions(user_id: str) -> List[Dict[str, Any]]:
+def get_aptitude_questions(user_id: str) -> List[sqlite3.Row]:
     """
     Get all aptitude questions for a specific user
-    
+
     Args:
         user_id: The ID of the user
-        
+
     Returns:
-        List of dictionaries with question text and correct answers
+        List of sqlite3.Row objects with question text and correct answers;
+        rows support both row['question'] and positional access, so no
+        per-row dict is materialized (use dict(row) if one is needed)
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        '''
-        SELECT id, question, correct_answer
-        FROM aptitude_questions
-        WHERE user_id = ?
-        ORDER BY id
-        LIMIT 5
-        ''',
-        (user_id,)
-    )
-    
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    
-    return results
-
-# Initialize the database when the module is imported
-initialize_db()
\ No newline at end of file
+    cursor = _get_conn().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(_SQL_GET_APTITUDE_QUESTIONS, (user_id,))
+
+    return cursor.fetchall()
+
+# Async wrappers for FastAPI handlers: the sync helpers block on SQLite I/O
+# and the write lock, so awaiting them through a worker thread keeps the
+# event loop free while reusing the shared connection and its caches
+
+async def get_video_questions_async(user_id: str) -> List[sqlite3.Row]:
+    """Async counterpart of get_video_questions"""
+    return await asyncio.to_thread(get_video_questions, user_id)
+
+async def get_aptitude_questions_async(user_id: str) -> List[sqlite3.Row]:
+    """Async counterpart of get_aptitude_questions"""
+    return await asyncio.to_thread(get_aptitude_questions, user_id)
+
+async def get_user_assessment_history_async(user_id: str) -> List[Dict[str, Any]]:
+    """Async counterpart of get_user_assessment_history"""
+    return await asyncio.to_thread(get_user_assessment_history, user_id)
+
+async def get_latest_learner_type_async(user_id: str) -> Optional[str]:
+    """Async counterpart of get_latest_learner_type"""
+    return await asyncio.to_thread(get_latest_learner_type, user_id)
+
+async def save_user_assessment_async(user_id: str, video_score: int, aptitude_score: int, learner_type: str) -> int:
+    """Async counterpart of save_user_assessment"""
+    return await asyncio.to_thread(save_user_assessment, user_id, video_score, aptitude_score, learner_type)
+
+async def bulk_save_video_questions_async(user_id: str, questions_data: List[Dict[str, Any]], video_id: str = None) -> List[int]:
+    """Async counterpart of bulk_save_video_questions"""
+    return await asyncio.to_thread(bulk_save_video_questions, user_id, questions_data, video_id)
+
+async def bulk_save_aptitude_questions_async(user_id: str, questions_data: List[Dict[str, Any]]) -> List[int]:
+    """Async counterpart of bulk_save_aptitude_questions"""
+    return await asyncio.to_thread(bulk_save_aptitude_questions, user_id, questions_data)